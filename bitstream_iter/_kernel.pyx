@@ -0,0 +1,61 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Optional C implementations of bit packing used by bitstream.
+
+Build in place with: cythonize -i bitstream_iter/_kernel.pyx
+"""
+
+
+def pack_msb(const unsigned char[:] bits):
+    """Pack 0 or 1 bit values into bytes, most significant bit first.
+
+    Args:
+        bits: Bytes of 0 or 1 bit values. Extra bits after the last
+            whole byte are ignored.
+
+    Returns:
+        Bytes containing each group of 8 bits.
+    """
+    cdef Py_ssize_t index
+    cdef Py_ssize_t count = bits.shape[0] // 8
+    cdef bytearray packed = bytearray(count)
+    cdef unsigned char *out = packed
+    cdef const unsigned char *b
+
+    for index in range(count):
+        b = &bits[8 * index]
+        out[index] = ((b[0] != 0) << 7 | (b[1] != 0) << 6 |
+                      (b[2] != 0) << 5 | (b[3] != 0) << 4 |
+                      (b[4] != 0) << 3 | (b[5] != 0) << 2 |
+                      (b[6] != 0) << 1 | (b[7] != 0))
+
+    return bytes(packed)
+
+
+def unpack_msb(const unsigned char[:] data):
+    """Unpack bytes into 0 or 1 bit values, most significant bit first.
+
+    Args:
+        data: Bytes to unpack.
+
+    Returns:
+        Bytes containing one 0 or 1 value for each bit.
+    """
+    cdef Py_ssize_t index
+    cdef Py_ssize_t count = data.shape[0]
+    cdef bytearray bits = bytearray(8 * count)
+    cdef unsigned char *out = bits
+    cdef unsigned char value
+
+    for index in range(count):
+        value = data[index]
+        out[0] = (value >> 7) & 1
+        out[1] = (value >> 6) & 1
+        out[2] = (value >> 5) & 1
+        out[3] = (value >> 4) & 1
+        out[4] = (value >> 3) & 1
+        out[5] = (value >> 2) & 1
+        out[6] = (value >> 1) & 1
+        out[7] = value & 1
+        out += 8
+
+    return bytes(bits)
@@ -28,10 +28,22 @@ UINT64_LE - 64-bit unsigned, little-endian byte order
 
 The 16, 32, and 64-bit masks use most significant bit first in each byte.
 Custom masks can be created manually, or using create().
+
+combine_fast_msb8() and combine_fast_lsb8() are equivalent to combine() with
+UINT8_MSB_FIRST and UINT8_LSB_FIRST, for bits that are already 0 or 1.
+
+bit_positions() finds the bit position selected by each mask, if possible,
+which allows shifting values instead of testing each masked value.
+
+BYTE_TO_BITS maps id() of the unsigned 8-bit masks to a table of bits for
+each byte value, equivalent to applying the masks and testing each result.
+
+BITREV8 is a bytes.translate() table that reverses the bits of each byte,
+which converts between bytes packed with UINT8_MSB_FIRST and UINT8_LSB_FIRST.
 """
 
 import itertools
-from typing import Any, Iterable, Iterator, Sequence, Tuple
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple
 
 
 def create(width: int, signed: bool, lsb_first: bool = False,
@@ -104,6 +116,63 @@ def combine(masks: Sequence[int], bits: Iterable[Any]) -> int:
     return value
 
 
+def bit_positions(masks: Sequence[int]) -> Optional[Tuple[int, ...]]:
+    """Find the bit position selected by each bit mask.
+
+    Args:
+        masks: Bit masks to examine.
+
+    Returns:
+        Position of the single bit in each mask, such that (value >> position)
+        & 1 equals the truth value of (value & mask). None if any mask is not
+        a positive power of 2, including negative sign bit masks.
+    """
+    positions = _POSITIONS.get(id(masks))
+    if positions is not None:
+        return positions
+
+    if not all((mask > 0 and not mask & (mask - 1)) for mask in masks):
+        return None
+
+    return tuple((mask.bit_length() - 1) for mask in masks)
+
+
+def combine_fast_msb8(bits: Sequence[int]) -> int:
+    """Combine 8 bits of 0 or 1 into a byte, most significant bit first.
+
+    Args:
+        bits: Exactly 8 bit values, each 0 or 1.
+
+    Returns:
+        Integer value equal to combine(UINT8_MSB_FIRST, bits).
+    """
+    b0, b1, b2, b3, b4, b5, b6, b7 = bits
+    return (b0 << 7 | b1 << 6 | b2 << 5 | b3 << 4 |
+            b4 << 3 | b5 << 2 | b6 << 1 | b7)
+
+
+def combine_fast_lsb8(bits: Sequence[int]) -> int:
+    """Combine 8 bits of 0 or 1 into a byte, least significant bit first.
+
+    Args:
+        bits: Exactly 8 bit values, each 0 or 1.
+
+    Returns:
+        Integer value equal to combine(UINT8_LSB_FIRST, bits).
+    """
+    b0, b1, b2, b3, b4, b5, b6, b7 = bits
+    return (b0 | b1 << 1 | b2 << 2 | b3 << 3 |
+            b4 << 4 | b5 << 5 | b6 << 6 | b7 << 7)
+
+
+def _byte_bits(masks: Sequence[int]) -> Tuple[Tuple[int, ...], ...]:
+    """Create a table of 0 or 1 bits for each byte value using masks."""
+    return tuple(tuple((1 if value & mask else 0) for mask in masks)
+                 for value in range(256))
+
+
+_POSITIONS = {}  # type: Dict[int, Tuple[int, ...]]
+
 INT8_MSB_FIRST = create(width=8, signed=True)
 INT8_LSB_FIRST = create(width=8, signed=True, lsb_first=True)
 UINT8_MSB_FIRST = create(width=8, signed=False)
@@ -123,3 +192,15 @@ INT64_BE = create(width=64, signed=True)
 INT64_LE = create(width=64, signed=True, reverse_group_width=8)
 UINT64_BE = create(width=64, signed=False)
 UINT64_LE = create(width=64, signed=False, reverse_group_width=8)
+
+_POSITIONS.update(
+    (id(masks), bit_positions(masks))  # type: ignore
+    for masks in (UINT8_MSB_FIRST, UINT8_LSB_FIRST, UINT16_BE, UINT16_LE,
+                  UINT32_BE, UINT32_LE, UINT64_BE, UINT64_LE))
+
+BYTE_TO_BITS = {
+    id(UINT8_MSB_FIRST): _byte_bits(UINT8_MSB_FIRST),
+    id(UINT8_LSB_FIRST): _byte_bits(UINT8_LSB_FIRST),
+}
+
+BITREV8 = bytes(int('{:08b}'.format(value)[::-1], 2) for value in range(256))
@@ -1,18 +1,431 @@
+import functools
 import itertools
+import struct
 from collections import deque
-from typing import Any, Iterable, Iterator, MutableSequence, NewType, Sequence
+from typing import (Any, Callable, Iterable, Iterator, MutableSequence,
+                    NamedTuple, Optional, Sequence, Tuple, Union)
 
 from bitstream_iter import bitmasks
 
-
-Bit = NewType('Bit', int)
+try:
+    import bitarray
+except ImportError:  # optional, only needed for backend='bitarray'
+    bitarray = None
+
+
+# Bit values are plain integers 0 or 1. The alias documents annotations only.
+Bit = int
+
+# Standard masks with a dedicated function for combining 0 or 1 bit values,
+# which take precedence over _BYTE_LAYOUTS.
+_FAST_COMBINERS = {
+    id(bitmasks.UINT8_MSB_FIRST): bitmasks.combine_fast_msb8,
+    id(bitmasks.UINT8_LSB_FIRST): bitmasks.combine_fast_lsb8,
+}
+
+# Other standard masks that have whole bytes, mapped to (byte order, signed)
+# arguments for int.from_bytes(). Bytes are packed most significant bit first,
+# and reversed with BITREV8 for the masks in _BIT_REVERSED.
+_BYTE_LAYOUTS = {
+    id(bitmasks.INT8_MSB_FIRST): ('big', True),
+    id(bitmasks.INT8_LSB_FIRST): ('big', True),
+    id(bitmasks.UINT8_MSB_FIRST): ('big', False),
+    id(bitmasks.UINT8_LSB_FIRST): ('big', False),
+    id(bitmasks.INT16_BE): ('big', True),
+    id(bitmasks.INT16_LE): ('little', True),
+    id(bitmasks.UINT16_BE): ('big', False),
+    id(bitmasks.UINT16_LE): ('little', False),
+    id(bitmasks.INT32_BE): ('big', True),
+    id(bitmasks.INT32_LE): ('little', True),
+    id(bitmasks.UINT32_BE): ('big', False),
+    id(bitmasks.UINT32_LE): ('little', False),
+    id(bitmasks.INT64_BE): ('big', True),
+    id(bitmasks.INT64_LE): ('little', True),
+    id(bitmasks.UINT64_BE): ('big', False),
+    id(bitmasks.UINT64_LE): ('little', False),
+}
+
+_BIT_REVERSED = {id(bitmasks.INT8_LSB_FIRST), id(bitmasks.UINT8_LSB_FIRST)}
+
+# Unsigned struct format characters for whole-byte layouts, by byte count.
+_STRUCT_CODES = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+
+# Bytes converted at a time when reading buffered sources, so that reading
+# a few values does not copy all of the remaining data.
+_CHUNK_SIZE = 4096
+
+# Short sequences written as bits are copied into one trailing buffer, up to
+# a buffer size limit, instead of adding a source for each write.
+_COALESCE_TYPES = (list, tuple, bytes, bytearray)
+_COALESCE_MAX_LEN = 64
+_COALESCE_BUFFER_LIMIT = 4096
+
+# Translations between 0 or 1 bit values and binary digits for int().
+_BIT_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+_DIGIT_BITS = bytes.maketrans(b'01', b'\x00\x01')
 
 
 def make_bit(value: Any) -> Bit:
     """Convert any value to 0 or 1 using truth value testing."""
     if value:
-        return Bit(1)
-    return Bit(0)
+        return 1
+    return 0
+
+
+def _pack_msb(bits: bytes) -> bytes:
+    """Pack 0 or 1 bit values into bytes, most significant bit first.
+
+    Values must be 0 or 1. Extra bits after the last whole byte are ignored.
+    """
+    count = len(bits) // 8
+    if not count:
+        return b''
+
+    value = int(bytes(bits)[:8 * count].translate(_BIT_DIGITS), 2)
+    return value.to_bytes(count, 'big')
+
+
+def _unpack_msb(data: bytes) -> bytes:
+    """Unpack bytes into 0 or 1 bit values, most significant bit first."""
+    if not data:
+        return b''
+
+    digits = format(int.from_bytes(data, 'big'), 'b').zfill(8 * len(data))
+    return digits.encode('ascii').translate(_DIGIT_BITS)
+
+
+try:
+    from bitstream_iter._kernel import pack_msb as _pack_msb  # noqa: F811
+    from bitstream_iter._kernel import unpack_msb as _unpack_msb  # noqa: F811
+except ImportError:
+    pass
+
+
+def _combine_bytes(bits: bytes, byte_order: str, signed: bool,
+                   reverse_bits: bool = False) -> int:
+    """Combine 0 or 1 bit values for whole bytes into an integer.
+
+    Bits are packed into bytes with most significant bit first, and the bits
+    of each byte are reversed if requested. Then the bytes are converted to
+    an integer using the given byte order.
+    """
+    packed = _pack_msb(bits)
+    if reverse_bits:
+        packed = packed.translate(bitmasks.BITREV8)
+    return int.from_bytes(packed, byte_order, signed=signed)
+
+
+def _spread_ints(values: Iterable[int], width: int,
+                 byte_order: str) -> Iterator[bytes]:
+    """Iterator of 0 or 1 bit values for each unsigned integer, as bytes.
+
+    All bits of an integer are spread out by one format() call, with the
+    most significant bit first in each byte, and bytes in the given order.
+    Each integer passes through a single generator expression.
+    """
+    digits = '0{}b'.format(width)
+    mask = (1 << width) - 1
+    table = _DIGIT_BITS
+
+    if byte_order == 'big':
+        return (format(v & mask, digits).encode('ascii').translate(table)
+                for v in values)
+
+    count = width // 8
+    return (format(int.from_bytes((v & mask).to_bytes(count, 'little'), 'big'),
+                   digits).encode('ascii').translate(table) for v in values)
+
+
+class _MaskPlan(NamedTuple):
+    """Loop invariants for combining 0 or 1 bit values using bit masks."""
+
+    masks: Sequence[int]
+    width: int
+    layout: Optional[Tuple[str, bool]]
+    collect: Callable[[Iterable[Bit]], Sequence[Bit]]
+    combine: Callable[[Sequence[Bit]], int]
+    int_struct: Optional[struct.Struct]
+    reverse_bits: bool
+
+
+def _make_plan(masks: Sequence[int]) -> _MaskPlan:
+    """Select the fastest functions for combining bits using masks."""
+    layout = _BYTE_LAYOUTS.get(id(masks))
+    combine = _FAST_COMBINERS.get(id(masks))
+    reverse_bits = id(masks) in _BIT_REVERSED
+
+    if combine is not None:
+        collect = list  # type: Callable[[Iterable[Bit]], Sequence[Bit]]
+    elif layout is not None:
+        collect = bytes  # packed by _combine_bytes() without a copy
+        combine = functools.partial(_combine_bytes, byte_order=layout[0],
+                                    signed=layout[1],
+                                    reverse_bits=reverse_bits)
+    else:
+        collect = list
+        combine = functools.partial(bitmasks.combine, masks)
+
+    if layout is not None:
+        byte_order, signed = layout
+        code = _STRUCT_CODES[len(masks) // 8]
+        fmt = ('>' if byte_order == 'big' else '<') + (
+            code.lower() if signed else code)
+        packer = struct.Struct(fmt)  # type: Optional[struct.Struct]
+    else:
+        packer = None
+
+    return _MaskPlan(masks=masks, width=len(masks), layout=layout,
+                     collect=collect, combine=combine, int_struct=packer,
+                     reverse_bits=reverse_bits)
+
+
+def _plan(masks: Sequence[int]) -> _MaskPlan:
+    """Get the cached plan for standard masks, or make a new plan."""
+    plan = _PLANS.get(id(masks))
+    if plan is None or plan.masks is not masks:
+        plan = _make_plan(masks)
+    return plan
+
+
+_PLANS = {id(masks): _make_plan(masks) for masks in (
+    bitmasks.INT8_MSB_FIRST, bitmasks.INT8_LSB_FIRST,
+    bitmasks.UINT8_MSB_FIRST, bitmasks.UINT8_LSB_FIRST,
+    bitmasks.INT16_BE, bitmasks.INT16_LE,
+    bitmasks.UINT16_BE, bitmasks.UINT16_LE,
+    bitmasks.INT32_BE, bitmasks.INT32_LE,
+    bitmasks.UINT32_BE, bitmasks.UINT32_LE,
+    bitmasks.INT64_BE, bitmasks.INT64_LE,
+    bitmasks.UINT64_BE, bitmasks.UINT64_LE,
+)}
+
+
+class _ByteSource:
+    """Bytes written to a stream with standard 8-bit masks.
+
+    The bytes are kept as written, so reading integers with compatible masks
+    slices them directly. Bytes written with UINT8_LSB_FIRST are bytes with
+    most significant bit first, after reversing the bits with BITREV8.
+    Reading bits requires replacing the source with the iterator from
+    iter_bits().
+    """
+
+    __slots__ = ('data', 'masks', 'offset')
+
+    def __init__(self, data: Sequence[int], masks: Sequence[int]) -> None:
+        self.data = data
+        self.masks = masks
+        self.offset = 0
+
+    def _reverse_bits(self, plan: _MaskPlan) -> bool:
+        """Check if the bits of each byte are reversed for plan masks."""
+        return plan.reverse_bits != (self.masks is bitmasks.UINT8_LSB_FIRST)
+
+    def read_int(self, plan: _MaskPlan) -> Optional[int]:
+        """Read the next integer, if possible without expanding bits.
+
+        Args:
+            plan: Plan for the bit masks used for combining bits.
+
+        Returns:
+            Next integer value, or None if the masks are not compatible or
+            there are not enough bytes remaining.
+        """
+        offset = self.offset
+
+        if plan.masks is self.masks:
+            if offset >= len(self.data):
+                return None
+            self.offset = offset + 1
+            return self.data[offset]
+
+        layout = plan.layout
+        if layout is None:
+            return None
+
+        end = offset + plan.width // 8
+        if end > len(self.data):
+            return None
+
+        self.offset = end
+        data = self.data[offset:end]
+        if self._reverse_bits(plan):
+            data = bytes(data).translate(bitmasks.BITREV8)
+
+        byte_order, signed = layout
+        return int.from_bytes(data, byte_order, signed=signed)
+
+    def read_bytes(self, plan: _MaskPlan) -> Optional[Sequence[int]]:
+        """Read all remaining bytes, if they were written with plan masks.
+
+        Args:
+            plan: Plan for the bit masks used for combining bits into bytes.
+
+        Returns:
+            Remaining bytes, or None if the masks are not unsigned 8-bit
+            standard masks.
+        """
+        if plan.masks is self.masks:
+            data = self.data[self.offset:]
+        elif id(plan.masks) in bitmasks.BYTE_TO_BITS:
+            data = bytes(self.data[self.offset:]).translate(bitmasks.BITREV8)
+        else:
+            return None
+
+        self.offset = len(self.data)
+        return data
+
+    def unpack(self, plan: _MaskPlan) -> Iterator[int]:
+        """Generate integers from all remaining whole values using struct.
+
+        Only bytes are unpacked, and not bytearrays, which cannot be resized
+        while struct is reading them. Bit-reversed bytes are translated in
+        chunks, so that reading a few values does not copy all the data.
+
+        Args:
+            plan: Plan for whole-byte standard masks, which has an int_struct.
+
+        Yields:
+            Next integer value, after advancing the offset past it. Stops if
+            another reader has moved the offset since the previous value.
+        """
+        data = self.data
+        if not isinstance(data, bytes):
+            return
+
+        int_struct = plan.int_struct
+        size = int_struct.size
+        offset = self.offset
+        end = offset + (len(data) - offset) // size * size
+
+        if not self._reverse_bits(plan):
+            for value, in int_struct.iter_unpack(memoryview(data)[offset:end]):
+                if self.offset != offset:
+                    return
+                offset += size
+                self.offset = offset
+                yield value
+            return
+
+        for start in range(offset, end, _CHUNK_SIZE):
+            chunk = data[start:min(start + _CHUNK_SIZE, end)]
+            for value, in int_struct.iter_unpack(
+                    chunk.translate(bitmasks.BITREV8)):
+                if self.offset != offset:
+                    return
+                offset += size
+                self.offset = offset
+                yield value
+
+    def iter_bits(self) -> Iterator[Bit]:
+        """Iterator with 0 or 1 values of the remaining bits."""
+        data = self.data
+        if isinstance(data, bytes):
+            chunks = (data[start:start + _CHUNK_SIZE] for start in
+                      range(self.offset, len(data), _CHUNK_SIZE))
+            if self.masks is bitmasks.UINT8_LSB_FIRST:
+                chunks = (chunk.translate(bitmasks.BITREV8)
+                          for chunk in chunks)
+            return itertools.chain.from_iterable(map(_unpack_msb, chunks))
+
+        table = bitmasks.BYTE_TO_BITS[id(self.masks)]
+        values = itertools.islice(data, self.offset, None)
+        return itertools.chain.from_iterable(map(table.__getitem__, values))
+
+
+class _BitarraySource:
+    """Bits copied into a bitarray, for streams with backend='bitarray'.
+
+    Bits may be appended to the bitarray until the source is replaced with
+    the iterator from iter_bits(). Integers with whole-byte standard masks
+    are read by slicing at any bit offset.
+    """
+
+    __slots__ = ('data', 'offset')
+
+    def __init__(self) -> None:
+        self.data = bitarray.bitarray(endian='big')
+        self.offset = 0
+
+    def read_int(self, plan: _MaskPlan) -> Optional[int]:
+        """Read the next integer, if possible without iterating bits.
+
+        Args:
+            plan: Plan for the bit masks used for combining bits.
+
+        Returns:
+            Next integer value, or None if the masks are not standard or
+            there are not enough bits remaining.
+        """
+        offset = self.offset
+        end = offset + plan.width
+
+        if plan.layout is None or end > len(self.data):
+            return None
+
+        self.offset = end
+        byte_order, signed = plan.layout
+        packed = self.data[offset:end].tobytes()
+        if plan.reverse_bits:
+            packed = packed.translate(bitmasks.BITREV8)
+        return int.from_bytes(packed, byte_order, signed=signed)
+
+    def read_bytes(self, plan: _MaskPlan) -> Optional[Sequence[int]]:
+        """Read all remaining whole bytes, if plan masks are unsigned 8-bit.
+
+        Args:
+            plan: Plan for the bit masks used for combining bits into bytes.
+
+        Returns:
+            Remaining whole bytes, or None if the masks are not compatible.
+        """
+        if id(plan.masks) not in bitmasks.BYTE_TO_BITS:
+            return None
+
+        offset = self.offset
+        end = offset + (len(self.data) - offset) // 8 * 8
+        self.offset = end
+        packed = self.data[offset:end].tobytes()
+        if plan.reverse_bits:
+            packed = packed.translate(bitmasks.BITREV8)
+        return packed
+
+    def unpack(self, plan: _MaskPlan) -> Iterator[int]:
+        """Generate integers from all remaining whole values using struct.
+
+        Args:
+            plan: Plan for whole-byte standard masks, which has an int_struct.
+
+        Yields:
+            Next integer value, after advancing the offset past it. Stops if
+            another reader has moved the offset since the previous value.
+        """
+        width = plan.width
+        step = 8 * _CHUNK_SIZE
+        offset = self.offset
+        end = offset + (len(self.data) - offset) // width * width
+
+        for start in range(offset, end, step):
+            packed = self.data[start:min(start + step, end)].tobytes()
+            if plan.reverse_bits:
+                packed = packed.translate(bitmasks.BITREV8)
+
+            for value, in plan.int_struct.iter_unpack(packed):
+                if self.offset != offset:
+                    return
+                offset += width
+                self.offset = offset
+                yield value
+
+    def iter_bits(self) -> Iterator[Bit]:
+        """Iterator with 0 or 1 values of the remaining bits."""
+        return iter(self.data[self.offset:])
+
+
+# Sources that are read directly by iter_ints, and expanded to bits by
+# _iter_sources() when necessary.
+_BUFFER_SOURCES = (_ByteSource, _BitarraySource)
+
+_Source = Union[Iterator[Bit], _ByteSource, _BitarraySource]
 
 
 class BitStream:
@@ -22,9 +435,10 @@ class BitStream:
     BitStream(bits)               -> BitStream with bit values
     BitStream.from_bytes(values)  -> BitStream with bits extracted from bytes
 
-    The constructors take two optional arguments:
+    The constructors take three optional arguments:
         byte_bitmasks - bit masks for converting bytes
         end_fill - bit value to fill the end of the stream for bytes/ints
+        backend - 'iter' for lazy iterators, or 'bitarray' to copy bits
 
     I/O methods with b = BitStream(...):
         Write data with b.write_bits(), b.write_bytes(), or b.write_ints().
@@ -33,7 +447,8 @@ class BitStream:
 
     def __init__(self, bits: Iterable[Any] = None,
                  byte_bitmasks: Sequence[int] = None,
-                 end_fill: Any = 0) -> None:
+                 end_fill: Any = 0,
+                 backend: str = 'iter') -> None:
         """Initialize a new bit stream.
 
         Args:
@@ -47,11 +462,25 @@ class BitStream:
                 bytes/ints. Default is 0 to consume all bits from the stream.
                 None leaves unused bits in the stream, and requires a new
                 iterator to read data after adding more bits.
+
+            backend: 'iter' keeps written values as lazily accessed iterators.
+                'bitarray' copies lists, tuples, bytes, and bitarrays written
+                at the end of the stream into a bitarray, which requires the
+                optional bitarray package.
         """
-        self.byte_bitmasks = byte_bitmasks or bitmasks.UINT8_MSB_FIRST
-        self.end_fill = None if end_fill is None else Bit(end_fill)
+        if backend not in ('iter', 'bitarray'):
+            raise ValueError('Unknown backend: {!r}'.format(backend))
+        if backend == 'bitarray' and bitarray is None:
+            raise ImportError("backend='bitarray' requires bitarray package")
 
-        self._bit_sources = deque()  # type: MutableSequence[Iterator[Bit]]
+        self.backend = backend
+        self.byte_bitmasks = (byte_bitmasks if byte_bitmasks is not None
+                              else bitmasks.UINT8_MSB_FIRST)
+        self.end_fill = None if end_fill is None else (1 if end_fill else 0)
+
+        self._bit_sources = deque()  # type: MutableSequence[_Source]
+        self._tail = bytearray()
+        self._tail_source = None  # type: Optional[_Source]
 
         if bits is not None:
             self.write_bits(bits)
@@ -59,7 +488,8 @@ class BitStream:
     @classmethod
     def from_bytes(cls, values: Iterable[int],
                    byte_bitmasks: Sequence[int] = None,
-                   end_fill: Any = 0) -> 'BitStream':
+                   end_fill: Any = 0,
+                   backend: str = 'iter') -> 'BitStream':
         """Create a bit stream containing bytes.
 
         Args:
@@ -73,10 +503,14 @@ class BitStream:
                 None leaves unused bits in the stream, and requires a new
                 iterator to read data after adding more bits.
 
+            backend: 'iter' keeps written values as lazily accessed iterators.
+                'bitarray' copies bytes-like values into a bitarray.
+
         Returns:
             A new BitStream initialized with the given data.
         """
-        stream = cls(byte_bitmasks=byte_bitmasks, end_fill=end_fill)
+        stream = cls(byte_bitmasks=byte_bitmasks, end_fill=end_fill,
+                     backend=backend)
         stream.write_bytes(values=values)
         return stream
 
@@ -87,24 +521,37 @@ class BitStream:
             Bytes formed by consuming all possible bits from the stream.
             Uses byte_bitmasks and end_fill from the constructor.
         """
-        return bytes(self.iter_bytes())
+        plan = _plan(self.byte_bitmasks)
+        sources = self._bit_sources
+        packed = bytearray()
+
+        while sources and type(sources[0]) in _BUFFER_SOURCES:
+            source = sources[0]
+            data = source.read_bytes(plan=plan)
+            if data is None:
+                break
+
+            packed += data
+            if source.offset < len(source.data):
+                break
+
+            sources.popleft()  # type: ignore # Deque in 3.6.1
+
+        packed.extend(self.iter_bytes())
+        return bytes(packed)
 
     def __iter__(self) -> Iterator[Bit]:
         """Implements iter(self).
 
-        Yields:
-            Next bit value as integer 0 or 1, consumed from the start of the
-            stream until all all bits have been exhausted. After the end of
-            the stream is reached, any new data written to the stream is only
-            accessible by creating a new iterator.
+        Returns:
+            Iterator that produces each bit value as integer 0 or 1, consumed
+            from the start of the stream until all bits have been exhausted.
+            After the end of the stream is reached, any new data written to
+            the stream is only accessible by creating a new iterator.
+            Bits written at the start while the iterator is partway through
+            the values of one write are produced after the rest of them.
         """
-        while len(self._bit_sources):
-            bit = next(self._bit_sources[0], None)
-            if bit is None:
-                del self._bit_sources[0]
-                continue
-
-            yield bit
+        return itertools.chain.from_iterable(self._iter_sources())
 
     def iter_bytes(self, masks: Sequence[int] = None,
                    end_fill: Any = -1) -> Iterator[int]:
@@ -125,7 +572,7 @@ class BitStream:
             only accessible by creating a new iterator.
 
         """
-        masks = masks or self.byte_bitmasks
+        masks = masks if masks is not None else self.byte_bitmasks
         return self.iter_ints(masks=masks, end_fill=end_fill)
 
     def iter_ints(self, masks: Sequence[int],
@@ -148,21 +595,57 @@ class BitStream:
         if end_fill == -1:
             end_fill = self.end_fill
 
+        plan = _plan(masks)
+        width, collect, combine = plan.width, plan.collect, plan.combine
+        sources = self._bit_sources
         bit_iter = iter(self)
 
-        while True:
-            bits = list(itertools.islice(bit_iter, len(masks)))
-
-            if not len(bits):
-                return
-            elif len(bits) < len(masks) and end_fill is None:
-                self.write_bits(bits)
-                return
+        # Empty masks would never make a short read, so stop like one.
+        if not width:
+            return
 
-            while end_fill and len(bits) < len(masks):
-                bits.append(end_fill)
-
-            yield bitmasks.combine(masks=masks, bits=bits)
+        while True:
+            source = sources[0] if sources else None
+            if type(source) in _BUFFER_SOURCES:
+                if source.offset >= len(source.data):
+                    sources.popleft()  # type: ignore # Deque in 3.6.1
+                    continue
+
+                if plan.int_struct is not None:
+                    offset = source.offset
+                    for value in source.unpack(plan=plan):
+                        yield value
+                        # Other readers may replace or precede the source.
+                        if not sources or sources[0] is not source:
+                            break
+                    if source.offset != offset:
+                        continue
+
+                value = source.read_int(plan=plan)
+                if value is not None:
+                    read_int = source.read_int
+                    while value is not None:
+                        yield value
+                        if not sources or sources[0] is not source:
+                            break
+                        value = read_int(plan=plan)
+                    continue
+
+            bits = collect(itertools.islice(bit_iter, width))
+            if len(bits) < width:
+                break
+
+            yield combine(bits)
+
+        # Only the last integer may be partial, so end_fill is checked once.
+        if not len(bits):
+            return
+        elif end_fill is None:
+            self._write_source(source=iter(bits), at_start=False)
+            return
+
+        bits += collect((make_bit(end_fill),)) * (width - len(bits))
+        yield combine(bits)
 
     def write_bits(self, values: Iterable[Any],
                    at_start: bool = False) -> None:
@@ -171,14 +654,31 @@ class BitStream:
         Args:
             values: Bit values that are accessed when consuming stream bits.
                 Each value is converted to 0 or 1 by truth value testing.
+                Short lists, tuples, and bytes written at the end are
+                accessed immediately, and combined with adjacent writes.
+                With backend='bitarray', lists, tuples, bytes, and bitarrays
+                of any length written at the end are copied into a bitarray.
 
             at_start: Write bits at the start of the stream instead of the end.
+                An iterator that is partway through the values of an earlier
+                write reads the new bits after the rest of those values.
         """
-        bits = (make_bit(b) for b in values)
-        if at_start:
-            self._bit_sources.appendleft(bits)  # type: ignore # Deque in 3.6.1
-        else:
-            self._bit_sources.append(bits)
+        if self.backend == 'bitarray' and not at_start and (
+                type(values) in _COALESCE_TYPES or
+                isinstance(values, bitarray.bitarray)):
+            if isinstance(values, bitarray.bitarray):
+                self._tail_bitarray().extend(values)
+            else:
+                self._tail_bitarray().extend([(1 if b else 0) for b in values])
+            return
+
+        if (not at_start and type(values) in _COALESCE_TYPES and
+                len(values) <= _COALESCE_MAX_LEN):
+            self._write_tail(bits=bytes([(1 if b else 0) for b in values]))
+            return
+
+        bits = ((1 if b else 0) for b in values)
+        self._write_source(source=bits, at_start=at_start)
 
     def write_bytes(self, values: Iterable[int], masks: Sequence[int] = None,
                     at_start: bool = False) -> None:
@@ -191,9 +691,29 @@ class BitStream:
                 Default is byte_bitmasks specified in the constructor.
 
             at_start: Write bits at the start of the stream instead of the end.
+                An iterator that is partway through the values of an earlier
+                write reads the new bits after the rest of those values.
         """
-        masks = masks or self.byte_bitmasks
-        self.write_ints(values=values, masks=masks, at_start=at_start)
+        masks = masks if masks is not None else self.byte_bitmasks
+        table = bitmasks.BYTE_TO_BITS.get(id(masks))
+        if table is None:
+            self.write_ints(values=values, masks=masks, at_start=at_start)
+            return
+
+        if isinstance(values, (bytes, bytearray)) or (
+                isinstance(values, memoryview) and values.format == 'B' and
+                values.ndim == 1 and values.c_contiguous):
+            if self.backend == 'bitarray' and not at_start:
+                self._write_bitarray_bytes(values=values, masks=masks)
+                return
+
+            self._write_source(source=_ByteSource(data=values, masks=masks),
+                               at_start=at_start)
+            return
+
+        byte_bits = (table[v & 0xFF] for v in values)
+        bits = itertools.chain.from_iterable(byte_bits)
+        self._write_source(source=bits, at_start=at_start)
 
     def write_ints(self, values: Iterable[int], masks: Sequence[int],
                    at_start: bool = False) -> None:
@@ -205,8 +725,94 @@ class BitStream:
             masks: Bit masks applied to each integer to produce bits.
 
             at_start: Write bits at the start of the stream instead of the end.
+                An iterator that is partway through the values of an earlier
+                write reads the new bits after the rest of those values.
+        """
+        layout = _BYTE_LAYOUTS.get(id(masks))
+        if layout is not None and not layout[1] and len(masks) > 8:
+            int_bits = _spread_ints(values=values, width=len(masks),
+                                    byte_order=layout[0])
+            bits = itertools.chain.from_iterable(int_bits)
+            self._write_source(source=bits, at_start=at_start)
+            return
+
+        positions = bitmasks.bit_positions(masks)
+        if positions is not None:
+            bits = ((v >> p) & 1 for v in values for p in positions)
+            self._write_source(source=bits, at_start=at_start)
+            return
+
+        bits = ((1 if v & m else 0) for v in values for m in masks)
+        self._write_source(source=bits, at_start=at_start)
+
+    def _iter_sources(self) -> Iterator[Iterator[Bit]]:
+        """Generate bit iterators from the start of the stream.
+
+        Each source is removed from the stream when the generator resumes,
+        after the consumer has exhausted it.
+        """
+        sources = self._bit_sources
+
+        while sources:
+            source = sources[0]
+            if type(source) in _BUFFER_SOURCES:
+                source = sources[0] = source.iter_bits()
+
+            yield source
+
+            if sources and sources[0] is source:
+                sources.popleft()  # type: ignore # Deque in 3.6.1
+            elif source in sources:
+                sources.remove(source)
+
+    def _write_tail(self, bits: bytes) -> None:
+        """Add 0 or 1 bits to the trailing buffer at the end of the stream.
+
+        A new buffer is started when the current one has been removed from
+        the stream, or has reached the size limit.
+        """
+        sources = self._bit_sources
+
+        if (sources and sources[-1] is self._tail_source and
+                len(self._tail) < _COALESCE_BUFFER_LIMIT):
+            self._tail += bits
+            return
+
+        self._tail = bytearray(bits)
+        self._tail_source = iter(self._tail)
+        sources.append(self._tail_source)
+
+    def _tail_bitarray(self) -> 'bitarray.bitarray':
+        """Get the trailing bitarray at the end of the stream for writing.
+
+        A new bitarray is started when the current one has been removed from
+        the stream, or replaced by an iterator.
         """
-        masked_values = (bitmasks.apply(masks=masks, value=v) for v in values)
-        flat_values = itertools.chain.from_iterable(masked_values)
+        sources = self._bit_sources
+
+        if not (sources and sources[-1] is self._tail_source):
+            self._tail_source = _BitarraySource()
+            sources.append(self._tail_source)
+
+        return self._tail_source.data  # type: ignore
+
+    def _write_bitarray_bytes(self, values: bytes,
+                              masks: Sequence[int]) -> None:
+        """Copy bytes with standard 8-bit masks into the trailing bitarray."""
+        if masks is bitmasks.UINT8_LSB_FIRST:
+            values = bytes(values).translate(bitmasks.BITREV8)
+
+        self._tail_bitarray().frombytes(values)
 
-        self.write_bits(values=flat_values, at_start=at_start)
+    def _write_source(self, source: _Source, at_start: bool) -> None:
+        """Add a source of bits at the end or start of the stream.
+
+        Args:
+            source: Iterator of 0 or 1 bit values, or bytes to expand later.
+
+            at_start: Write bits at the start of the stream instead of the end.
+        """
+        if at_start:
+            self._bit_sources.appendleft(source)  # type: ignore # Deque 3.6.1
+        else:
+            self._bit_sources.append(source)